@@ -24,7 +24,7 @@
 #                                                                                       #
 #########################################################################################
 
-import os
+import sys
 import flexistack
 
 #########################################################################################
@@ -36,16 +36,21 @@ if __name__=="__main__":
     # Create an instance of the Flexistack framework
     fstack = flexistack.Flexistack()
 
+    # Only register the requested action path; flags such as -h/--help need the full tree
+    command = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('-'):
+            break
+        command.append(arg)
+
     # Load actions and plugins
-    fstack.load(":core/", ":actions/",":plugins/")
+    fstack.load(":core/", ":actions/",":plugins/", command)
 
     # Parse arguments
     _, unknown_args = fstack.parse_arguments()
 
     # Execute actions/plugins based on given args
     fstack.run()
-    
-    pass
 
 #########################################################################################
 # END OF FILE                                                                           #
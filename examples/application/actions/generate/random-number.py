@@ -47,6 +47,7 @@ class Action:
     # ###################################################################################
 
     length = None
+    dummy_generator = None
     
     # ###################################################################################
     # USER CODE SECTION 1 - END                                                         #
@@ -61,25 +62,24 @@ class Action:
         parser.add_argument('-l', 
                             '--length', 
                             action='store', 
+                            type=int,
                             help="Requested number length")
 
     # --------------------------------------------------------------------------------- #
         
     def init(self,**kargs):
-        try:
-            args = kargs['pargs']
-            if ('length' in args):
-                self.length = int(args['length'])
-                return True
-        except:
-            pass
-        return False         
+        args = kargs.get('pargs')
+        if not args:
+            return False
+        self.length = args.get('length')
+        return self.length is not None
 
     # --------------------------------------------------------------------------------- #
 
     def run(self,**kargs):
-        dummy_generator = self.flexistack.plugins['dummy-generator']()
-        print(dummy_generator.random_number(self.length))
+        if self.dummy_generator is None:
+            self.dummy_generator = self.flexistack.plugins['dummy-generator']()
+        print(self.dummy_generator.random_number(self.length))
         return True
 
     # ###################################################################################
@@ -28,7 +28,6 @@
 # IMPORTS                                                                               #
 #########################################################################################
 
-import random
 from flexistack import *
 
 #########################################################################################
@@ -48,6 +47,8 @@ class Action:
     # ###################################################################################
 
     data = None
+    numpy_threshold = 4096  # inputs from this length on are shuffled with numpy (if installed)
+    numpy_rng       = None  # shared, created once (non-cryptographic PCG64DXSM)
     
     # ###################################################################################
     # USER CODE SECTION 1 - END                                                         #
@@ -67,23 +68,38 @@ class Action:
     # --------------------------------------------------------------------------------- #
         
     def init(self,**kargs):
-        try:
-            args = kargs['pargs']
-            if ('data' in args):
-                self.data = args['data']
-                return True
-        except:
-            pass
-        return False          
+        args = kargs.get('pargs')
+        if not args:
+            return False
+        self.data = args.get('data')
+        return self.data is not None
      
     # --------------------------------------------------------------------------------- #
 
     def run(self,**kargs):
-        char_list = list(self.data)    
-        random.shuffle(char_list)
-        print( ''.join(char_list))
+        shuffled = None
+        if len(self.data) >= self.numpy_threshold:
+            shuffled = self.numpy_shuffle(self.data)
+        if shuffled is None:
+            import random
+            shuffled = ''.join(random.sample(self.data, len(self.data)))
+        print(shuffled)
         return True
 
+    # --------------------------------------------------------------------------------- #
+
+    def numpy_shuffle(self, data):
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        # One array element per character: bytes for ASCII, code points otherwise
+        codec, dtype = ('ascii', np.uint8) if data.isascii() else ('utf-32-le', np.uint32)
+        chars = np.frombuffer(data.encode(codec, 'surrogatepass'), dtype=dtype)
+        if Action.numpy_rng is None:
+            Action.numpy_rng = np.random.Generator(np.random.PCG64DXSM())
+        return Action.numpy_rng.permuted(chars).tobytes().decode(codec, 'surrogatepass')
+
     # ###################################################################################
     # USER CODE SECTION 2 - END                                                         #
     # ###################################################################################
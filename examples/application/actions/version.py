@@ -28,10 +28,6 @@
 # IMPORTS                                                                               #
 #########################################################################################
 
-from os import listdir
-from os.path import abspath, dirname, isfile, join
-from genericpath import isdir
-
 from flexistack import *
 
 #########################################################################################
@@ -65,23 +61,21 @@ class Action:
     # --------------------------------------------------------------------------------- #
 
     def run(self,**kargs):
-        _print = self.flexistack.middleware.terminal.print
-        _print("Application - Testing application")
-        _print(" - Available actions: "+str(len(self.flexistack.actions)))
-        for action in self.flexistack.actions:
-            if self.flexistack.actions[action](None,True).Action._flexi_.get("as_optional") == None:
-                _print("  - "+action+": "+self.flexistack.actions[action].d)
-            else:
-                _print("  - --"+action+": "+self.flexistack.actions[action].d)    
-        _print(" - Available plugins: "+str(len(self.flexistack.plugins)))   
-        for plugin in self.flexistack.plugins:
-            versions = self.flexistack.plugins[plugin].versions()
-            versions.sort(reverse=False)
-            for v in versions:
-                rv = self.flexistack.plugins[plugin][v].d
-                if rv == None or rv == "":
-                    rv = "No available description"
-                _print("  - "+plugin+" ("+str(v)+"): "+rv)
+        _flexistack = self.flexistack
+        _print_many = _flexistack.middleware.terminal.print_many
+        _plugins = _flexistack.plugins
+        actions = [(name, action.t, action.d)
+                   for name, action in _flexistack.actions.items()]
+        plugins = [(name, v, pack[v].d or "No available description")
+                   for name, pack in _plugins.items()
+                   for v in reversed(pack.versions())]
+        lines = ["Application - Testing application",
+                 f" - Available actions: {len(actions)}"]
+        lines += [f"  - {name}: {description}" if kind == 'positional' else f"  - --{name}: {description}"
+                  for name, kind, description in actions]
+        lines.append(f" - Available plugins: {len(_plugins)}")
+        lines += [f"  - {name} ({v}): {description}" for name, v, description in plugins]
+        _print_many(lines)
         return True
 
     # ###################################################################################
@@ -34,8 +34,10 @@ import re
 import json
 import time
 import string
+import signal
 import datetime
 from threading import Lock
+from collections import deque
 from flexistack import *
 
 #########################################################################################
@@ -45,6 +47,22 @@ from flexistack import *
 safe_import("colorama")
 from colorama import just_fix_windows_console
 
+#########################################################################################
+# CONSTANTS                                                                             #
+#########################################################################################
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+class _AnsiCodes(dict):
+    def __missing__(self, key):
+        return ''
+
+# Placeholders for Terminal.fmt(), e.g. "{RD}error{RST}"; unknown names expand to ''
+_ANSI = _AnsiCodes(RD="\033[31m", GR="\033[32m", YW="\033[33m", BL="\033[34m",
+                   MG="\033[35m", CB="\033[36m", BB="\033[90m", BW="\033[97m",
+                   SU="\033[4m", EU="\033[24m", RST="\033[0m", INV="\033[7m", NRM="\033[27m")
+_NO_ANSI = _AnsiCodes()
+
 #########################################################################################
 # CLASS                                                                                 #
 #########################################################################################
@@ -73,13 +91,8 @@ class Terminal:
 
     # --------------------------------------------------------------------------------- #
 
-    supports_ansi   = False
-    max_columns     = 118
-
-    current_mode    = -1
-    loop_max_sz     = 8
-    text_buff       = []
-    lock_print      = None
+    __slots__ = ('basename', 'supports_ansi', 'max_columns', 'current_mode',
+                 'loop_max_sz', 'text_buff', 'lock_print')
     
     # ###################################################################################
     # USER CODE SECTION 1 - END                                                         #
@@ -91,8 +104,13 @@ class Terminal:
     # ###################################################################################
     
     def init(self):
+        self.supports_ansi = False
+        self.max_columns = 118
+        self.current_mode = -1
+        self.loop_max_sz = 8
         try:
             self.lock_print = Lock()
+            self.text_buff = deque(maxlen=1024)
             if sys.platform.startswith("win"):
                 just_fix_windows_console()
                 import ctypes
@@ -103,16 +121,26 @@ class Terminal:
                 self.supports_ansi = _mode.value & 0x0004 != 0
             else:
                 self.supports_ansi = True  
+                if hasattr(signal, 'SIGWINCH'):
+                    try:
+                        signal.signal(signal.SIGWINCH, self._on_resize)
+                    except ValueError:
+                        pass  # not the main thread: keep the one-shot value
             print("",end="", flush=True)
-            try:
-                self.max_columns = os.get_terminal_size().columns-2
-            except:
-                self.max_columns = 118            
+            self._on_resize()
             return True
-        except:
+        except Exception:
             return False
 
     # --------------------------------------------------------------------------------- #
+
+    def _on_resize(self, signum = None, frame = None):
+        try:
+            self.max_columns = os.get_terminal_size().columns-2
+        except (OSError, ValueError):
+            self.max_columns = 118
+
+    # --------------------------------------------------------------------------------- #
         
     def set_mode(self):
         pass
@@ -120,10 +148,26 @@ class Terminal:
     # --------------------------------------------------------------------------------- #
     
     def print(self, args):
-        self.lock_print.acquire()
-        print(args)
-        self.lock_print.release()
-        pass
+        buffer = str(args) + '\n'
+        with self.lock_print:
+            sys.stdout.write(buffer)
+
+    # --------------------------------------------------------------------------------- #
+
+    def fmt(self, template):
+        return template.format_map(_ANSI if self.supports_ansi else _NO_ANSI)
+
+    # --------------------------------------------------------------------------------- #
+
+    def strip_ansi(self, text):
+        return _ANSI_RE.sub('', text)
+
+    # --------------------------------------------------------------------------------- #
+
+    def print_many(self, lines):
+        buffer = '\n'.join(map(str, lines)) + '\n'
+        with self.lock_print:
+            sys.stdout.write(buffer)
         
     # ###################################################################################
     # USER CODE SECTION 2 - END                                                         #
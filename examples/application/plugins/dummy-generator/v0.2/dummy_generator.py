@@ -56,14 +56,17 @@ class Plugin():
     # ###################################################################################
 
     def init(self,**kargs):
-        print ("Dummy Data Generator Init")
-        pass
+        self.flexistack.dprint(0,"inf","Dummy Data Generator Init")
 
     def random_string(self,length):
-        return self.flexistack.helper.generate_random_string(length)
+        # First call binds the helper on the instance, later calls skip this method
+        self.random_string = self.flexistack.helper.generate_random_string
+        return self.random_string(length)
 
     def random_number(self,length):
-        return self.flexistack.helper.generate_random_number(length)
+        # First call binds the helper on the instance, later calls skip this method
+        self.random_number = self.flexistack.helper.generate_random_number
+        return self.random_number(length)
     
     # ###################################################################################
     # USER CODE SECTION 2 - END                                                         #
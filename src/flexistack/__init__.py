@@ -1,5 +1,5 @@
-from .flexistack import Flexistack, flexi_action, flexi_middleware, flexi_plugin, safe_import
+from .flexistack import Flexistack, flexi_action, flexi_middleware, flexi_plugin, requires_plugins, safe_import, safe_import_all
 
 __version__ = '0.2.23'
 __name__        = "flexistack"
-__all__         = ['Flexistack', 'flexi_action', 'flexi_middleware', 'flexi_plugin', 'safe_import']
+__all__         = ['Flexistack', 'flexi_action', 'flexi_middleware', 'flexi_plugin', 'requires_plugins', 'safe_import', 'safe_import_all']
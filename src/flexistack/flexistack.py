@@ -28,6 +28,74 @@
 # SAFE IMPORT (function)                                                                #
 #########################################################################################
 
+# Installed distribution versions looked up by safe_import (cleared after every install)
+_installed_versions = {}
+
+def _installed_version(package):
+    """
+    Returns the installed version of `package` (None if it has no distribution metadata).
+    """
+    import importlib.metadata
+
+    if package not in _installed_versions:
+        try:
+            _installed_versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            _installed_versions[package] = None
+    return _installed_versions[package]
+
+# ------------------------------------------------------------------------------------- #
+
+def _required_install(package, version = None):
+    """
+    Returns the pip requirement to install for `package` (None if the package can be 
+    imported and, when given, its installed version matches `version`). The version 
+    check is skipped, with a warning, for packages without distribution metadata under 
+    that name (stdlib modules, or import names that differ from the distribution).
+    """
+    import importlib
+
+    try:
+        importlib.import_module(package)
+    except ImportError:
+        return f"{package}=={version}" if version else package
+    if version:
+        installed_version = _installed_version(package)
+        if installed_version == None:
+            import warnings
+            warnings.warn(f"safe_import: no distribution metadata for '{package}', version {version} not checked")
+        elif installed_version != version:
+            return f"{package}=={version}"
+    return None
+
+# ------------------------------------------------------------------------------------- #
+
+def _pip_install(requirements):
+    """
+    Installs all the given requirements with a single `pip` invocation.
+    """
+    import sys
+    import importlib
+    import subprocess
+
+    if not requirements:
+        return
+    subprocess.call([sys.executable, "-m", "pip", "install", *requirements])
+    importlib.invalidate_caches()
+    _installed_versions.clear()
+
+# ------------------------------------------------------------------------------------- #
+
+def _bind_import(package, package_as = None):
+    """
+    Imports `package` into the flexistack module namespace (as `package_as` if given).
+    """
+    import importlib
+
+    globals()[package_as if package_as else package] = importlib.import_module(package)
+
+# ------------------------------------------------------------------------------------- #
+
 def safe_import(package: str, version: str = None, package_as: str = None) -> None:
     """
     Import a Python package safely and efficiently by checking if the package is
@@ -50,42 +118,38 @@ def safe_import(package: str, version: str = None, package_as: str = None) -> No
     None
     """
     import sys
-    import importlib
 
-    if package in sys.modules:
-        module = sys.modules[package]
-        if version:
-            import importlib.metadata
-            installed_version = importlib.metadata.version(package)
-            if installed_version != version:
-                subprocess.call([sys.executable, "-m", "pip", "install", f"{package}=={version}"])
-                module = importlib.import_module(package) 
-        if package_as:
-            globals()[package_as] = module
+    module = sys.modules.get(package)
+    if module != None and not version:
+        globals()[package_as if package_as else package] = module
         return
 
-    try:
-        module = importlib.import_module(package)
-        if version:
-            import importlib.metadata
-            installed_version = importlib.metadata.version(package)
-            if installed_version != version:
-                subprocess.call([sys.executable, "-m", "pip", "install", f"{package}=={version}"])
-                module = importlib.import_module(package) 
-    except ImportError:
-        install_cmd = [sys.executable, "-m", "pip", "install"]
-        if version:
-            install_cmd.append(f"{package}=={version}")
-        else:
-            install_cmd.append(package)
-        import subprocess
-        subprocess.call(install_cmd)
-        module = importlib.import_module(package)
+    requirement = _required_install(package, version)
+    _pip_install([requirement] if requirement else [])
+    _bind_import(package, package_as)
 
-    if package_as:
-        globals()[package_as] = module
-    else:
-        globals()[package] = module
+# ------------------------------------------------------------------------------------- #
+
+def safe_import_all(packages: list) -> None:
+    """
+    Same as `safe_import` for several packages, with all the missing (or mismatching)
+    ones installed by a single `pip` invocation.
+
+    Parameters:
+    -----------
+    packages: list
+        Package names (str) or tuples of (package, version[, package_as]).
+
+    Returns:
+    --------
+    None
+    """
+    specs = [(package, None, None) if isinstance(package, str) else (tuple(package) + (None, None))[:3] 
+             for package in packages]
+    _pip_install([requirement for requirement in (_required_install(package, version) 
+                  for package, version, _ in specs) if requirement])
+    for package, _, package_as in specs:
+        _bind_import(package, package_as)
 
 
 #########################################################################################
@@ -94,22 +158,147 @@ def safe_import(package: str, version: str = None, package_as: str = None) -> No
 
 import os
 import sys
-import ast
-import uuid
 import json
+import builtins
 import time
-import random
-import string
-import inspect
+import functools
+import itertools
+import threading
 import argparse
 import importlib.util
-from pathlib import Path
-from genericpath import isdir
 from os.path import isfile, join
 from consolio import Consolio
 from configvault import ConfigVault
 from .helper import Helper
 
+#########################################################################################
+# DISCOVERY HELPERS                                                                     #
+#########################################################################################
+
+@functools.lru_cache(maxsize=256)
+def _join_filepath(path, project_dir, cwd):
+    """
+    Returns the normalized absolute path of `path`: "::<path>" is relative to `cwd`, 
+    ":<path>" to `project_dir` and anything else is taken as is. Memoized, as the same 
+    few directories are resolved by every loader; being pure string handling, it cannot 
+    go stale (unlike the filesystem lookups of `Helper.resolve_path`).
+    """
+    if path.startswith("::"):
+        path = path[2:]
+        path = path[1:] if path.startswith("/") else path
+        path = path[1:] if path.startswith("\\") else path
+        return os.path.normpath(os.path.join(cwd,path))
+    elif path.startswith(":"):
+        path = path[1:]
+        path = path[1:] if path.startswith("/") else path
+        path = path[1:] if path.startswith("\\") else path
+        return os.path.normpath(os.path.join(project_dir,path))
+    return os.path.normpath(os.path.join(cwd,path))
+
+# ------------------------------------------------------------------------------------- #
+
+# Suffixes of the (unique) names under which the loaded modules are registered in sys.modules
+_MODULE_IDS = itertools.count()
+
+# ------------------------------------------------------------------------------------- #
+
+def _flexi_decorator(tree, name, nargs):
+    """
+    Returns the first top-level class definition of a parsed module that is decorated 
+    with a `name(...)` call of `nargs` positional arguments, together with that call 
+    (or None, None).
+    """
+    import ast
+
+    for node in tree.body:
+        if not isinstance(node,ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            if not isinstance(decorator,ast.Call):
+                continue
+            if isinstance(decorator.func,ast.Name):
+                dec_name = decorator.func.id
+            elif isinstance(decorator.func,ast.Attribute):
+                dec_name = decorator.func.attr
+            else:
+                continue
+            if dec_name == name and len(decorator.args) == nargs:
+                return node, decorator
+    return None, None
+
+# ------------------------------------------------------------------------------------- #
+
+# Layout of the discovery cache entries (bump it whenever the stored metadata changes)
+_CACHE_FORMAT = 1
+
+# Keys required in a cached (non-empty) metadata entry, per cache: any one of the sets
+_CACHE_FIELDS = {
+    'plugins': (frozenset(('class', 'name', 'version', 'description')),),
+    'actions': (frozenset(('class', 'description', 'type', 'arguments')),
+                frozenset(('class', 'description', 'type', 'as_optional'))),
+}
+
+def _valid_meta(name, meta):
+    """
+    Returns True if `meta` can be used as cached metadata of the `name` cache: None 
+    (not a flexistack module) or a dictionary with one of the required sets of keys.
+    """
+    if meta == None:
+        return True
+    if not isinstance(meta, dict):
+        return False
+    return any(fields <= meta.keys() for fields in _CACHE_FIELDS.get(name, (frozenset(),)))
+
+# ------------------------------------------------------------------------------------- #
+
+_SKIPPED_DIRS = frozenset(('__pycache__', 'node_modules', 'venv'))
+
+def _python_files(dir_path, onerror = None):
+    """
+    Yields the directory entries (os.DirEntry) of the Python source files under `dir_path`, 
+    without descending into hidden directories, `__pycache__`, virtual environments or 
+    symlinked directories. Like `os.walk`, directories that cannot be listed are skipped 
+    (after passing the OSError to `onerror`, if given).
+    """
+    try:
+        with os.scandir(dir_path) as dir_entries:
+            dir_entries = list(dir_entries)
+    except OSError as e:
+        if onerror != None:
+            onerror(e)
+        return
+    for dir_entry in dir_entries:
+        if dir_entry.is_dir(follow_symlinks=False):
+            if not dir_entry.name.startswith('.') and dir_entry.name not in _SKIPPED_DIRS:
+                yield from _python_files(dir_entry.path, onerror)
+        elif dir_entry.name.endswith('.py') and dir_entry.is_file():
+            yield dir_entry
+
+def _unique_python_files(dir_paths, onerror = None):
+    """
+    Yields the Python source files under all `dir_paths`, once each, even when the 
+    directories overlap (the same directory listed twice, or one nested in another).
+    """
+    seen = set()
+    for dir_path in dir_paths:
+        real_path = os.path.realpath(dir_path)
+        for dir_entry in _python_files(dir_path, onerror):
+            key = real_path + dir_entry.path[len(dir_path):]
+            if key in seen:
+                continue
+            seen.add(key)
+            yield dir_entry
+
+def _precompile(paths):
+    """
+    Byte-compiles the given module sources whose `.pyc` is missing or stale, so that 
+    their first (lazy) load reads the cached bytecode instead of compiling. Meant to 
+    run in a background thread.
+    """
+    import compileall
+    for path in paths:
+        compileall.compile_file(path, quiet=2)
+
 #########################################################################################
 # CLASS                                                                                 #
 #########################################################################################
@@ -118,14 +307,14 @@ class FlexiModule:
     """
     A class that wraps a loaded module object and its description.
     """
-    p = None # Module File Path
-    m = None # Module (actual)
-    d = None # Description
-    c = None # Class name
-    f = None # Flexistack instance
-    t = None # (applicable for actions) (T) positional, (F) optional 
-    n = None # Module Actual Name
-    u = None # Module Unique Name
+    __slots__ = ('p',  # Module File Path
+                 'm',  # Module (actual)
+                 'd',  # Description
+                 'c',  # Class name
+                 'f',  # Flexistack instance
+                 't',  # (applicable for actions) (T) positional, (F) optional 
+                 'n',  # Module Actual Name
+                 'u')  # Module Unique Name
     
     # --------------------------------------------------------------------------------- #
     # --------------------------------------------------------------------------------- #
@@ -139,18 +328,36 @@ class FlexiModule:
         - d: A string that describes the module.
         """
         self.p = p
+        self.m = None
         self.d = d
         self.c = c
         self.f = f  
         self.t = t      
         self.n = os.path.splitext(os.path.basename(p))[0]
-        self.u = f"{self.n}_{''.join(random.choices(string.ascii_letters, k=6))}"
+        self.u = f"{self.n}_{next(_MODULE_IDS)}"
 
         if lazy == False:
+            self.load()
+
+    # --------------------------------------------------------------------------------- #
+
+    def load(self):
+        """
+        Executes the module file (once) under its unique name and returns the module.
+        The module is registered in `sys.modules` before it is executed, as the import 
+        system does, and removed again if its execution fails.
+        """
+        if self.m == None:
             spec = importlib.util.spec_from_file_location(self.u, self.p)
-            self.m = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(self.m)            
-            sys.modules[self.u] = self.m           
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[self.u] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[self.u]
+                raise
+            self.m = module
+        return self.m
 
     # --------------------------------------------------------------------------------- #
         
@@ -163,14 +370,8 @@ class FlexiModule:
         - The loaded module object.
         """
         _flexistack = flexistack if flexistack != None else self.f        
-        
-        if self.m == None:
-            spec = importlib.util.spec_from_file_location(self.u, self.p)
-            self.m = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(self.m)            
-            sys.modules[self.u] = self.m
-            
-        return getattr(self.m,self.c)(_flexistack) if as_module == False else self.m
+        module = self.m if self.m != None else self.load()
+        return getattr(module,self.c)(_flexistack) if as_module == False else module
 
 #########################################################################################
 # CLASS                                                                                 #
@@ -186,7 +387,79 @@ class FlexiModPack(dict):
         """
         Constructor method for the ModulePack class.
         """    
-        pass
+        self._versions = None
+
+    # --------------------------------------------------------------------------------- #
+
+    def __setitem__(self, version, module):
+        """
+        Registers a module version and invalidates the cached version order.
+        """
+        super().__setitem__(version, module)
+        self._versions = None
+
+    # --------------------------------------------------------------------------------- #
+
+    def __delitem__(self, version):
+        """
+        Removes a module version and invalidates the cached version order.
+        """
+        super().__delitem__(version)
+        self._versions = None
+
+    # --------------------------------------------------------------------------------- #
+
+    def pop(self, *args):
+        """
+        Removes a module version (dict.pop) and invalidates the cached version order.
+        """
+        self._versions = None
+        return super().pop(*args)
+
+    # --------------------------------------------------------------------------------- #
+
+    def popitem(self):
+        """
+        Removes the last inserted module version and invalidates the cached version order.
+        """
+        self._versions = None
+        return super().popitem()
+
+    # --------------------------------------------------------------------------------- #
+
+    def clear(self):
+        """
+        Removes all module versions and invalidates the cached version order.
+        """
+        self._versions = None
+        super().clear()
+
+    # --------------------------------------------------------------------------------- #
+
+    def update(self, *args, **kwargs):
+        """
+        Registers several module versions and invalidates the cached version order.
+        """
+        self._versions = None
+        super().update(*args, **kwargs)
+
+    # --------------------------------------------------------------------------------- #
+
+    def __ior__(self, other):
+        """
+        Registers several module versions (|=) and invalidates the cached version order.
+        """
+        self._versions = None
+        return super().__ior__(other)
+
+    # --------------------------------------------------------------------------------- #
+
+    def setdefault(self, version, module = None):
+        """
+        Registers a module version if missing and invalidates the cached version order.
+        """
+        self._versions = None
+        return super().setdefault(version, module)
 
     # --------------------------------------------------------------------------------- #
 
@@ -195,7 +468,20 @@ class FlexiModPack(dict):
         Returns an object of the latest version of the module in the ModulePack.
         """    
         
-        return self[self.versions()[0]](flexistack,as_module) 
+        return self[self._ordered()[0]](flexistack,as_module) 
+
+    # --------------------------------------------------------------------------------- #
+
+    def _ordered(self):
+        """
+        Returns the cached tuple of version numbers (descending), sorting them only 
+        after the ModulePack has changed.
+        """
+        if self._versions is None:
+            self._versions = tuple(sorted(self.keys(), key=lambda version: 
+                                   (tuple(map(int, version.split('.')))), 
+                                   reverse=True))
+        return self._versions
 
     # --------------------------------------------------------------------------------- #
 
@@ -208,9 +494,7 @@ class FlexiModPack(dict):
         - A list of version numbers as strings, sorted 
           in descending order.
         """
-        return sorted(self.keys(), key=lambda version: 
-                  (tuple(map(int, version.split('.')))), 
-                  reverse=True)
+        return list(self._ordered())
 
 #########################################################################################
 # CLASS                                                                                 #
@@ -220,8 +504,85 @@ class FlexiModules(dict):
     """
     A dictionary-like class that stores multiple versions of a 
     module under different version numbers as keys.
+
+    Loaders may be deferred; they run on the first access to the contents.
     """
 
+    def __init__(self):
+        """
+        Constructor method for the FlexiModules class.
+        """
+        super().__init__()
+        self._pending = []
+        self._lock = threading.RLock()
+        self._resolving = False
+
+    # --------------------------------------------------------------------------------- #
+
+    def defer(self, loader):
+        """
+        Registers a callable that populates the container on first access.
+        """
+        self._pending.append(loader)
+
+    # --------------------------------------------------------------------------------- #
+
+    def resolve(self):
+        """
+        Runs all the deferred loaders (if any). Other threads wait until they have all 
+        completed; accesses made by the loaders themselves see the partial contents. 
+        A loader is dropped only once it has completed, so a failed one runs again on 
+        the next access.
+        """
+        if not self._pending:
+            return
+        with self._lock:
+            if self._resolving:
+                return
+            self._resolving = True
+            try:
+                while self._pending:
+                    self._pending[0]()
+                    del self._pending[0]
+            finally:
+                self._resolving = False
+
+    # --------------------------------------------------------------------------------- #
+
+    def __getitem__(self, key):
+        self.resolve()
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.resolve()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.resolve()
+        return super().__iter__()
+
+    def __len__(self):
+        self.resolve()
+        return super().__len__()
+
+    def get(self, key, default = None):
+        self.resolve()
+        return super().get(key, default)
+
+    def keys(self):
+        self.resolve()
+        return super().keys()
+
+    def values(self):
+        self.resolve()
+        return super().values()
+
+    def items(self):
+        self.resolve()
+        return super().items()
+
+    # --------------------------------------------------------------------------------- #
+
     def __call__(self, flexistack = None, as_module = False):
         """
         Returns an object of the latest version of the module in the ModulePack.
@@ -264,20 +625,16 @@ class FlexiModules(dict):
         and False otherwise.
 
         Args:
-        - mod_names: A string or a list of strings representing 
+        - mod_names: A string or a list (tuple/set) of strings representing 
           module names.
 
         Returns:
         - True if all specified modules exist in the Autoloader, 
           and False otherwise.
         """
-        if isinstance(mod_names, list):
-            for mod_name in mod_names:
-                if self.get(mod_name) is None:
-                    return False
-            return True
-        else:
-            return True if self.get(mod_names) is not None else False
+        if isinstance(mod_names, (list, tuple, set, frozenset)):
+            return all(mod_name in self for mod_name in mod_names)
+        return mod_names in self
 
 #########################################################################################
 # CLASS                                                                                 #
@@ -307,9 +664,9 @@ class Flexistack():
 
     project_dir     = None
     uuid            = None
-    actions         = FlexiModules()
-    plugins         = FlexiModules()
-    middleware      = type('', (), {})()
+    actions         = None
+    plugins         = None
+    middleware      = None
     parser          = None
     parsed_args     = None
     debug           = False    
@@ -317,6 +674,7 @@ class Flexistack():
     config_vault    = None
     chrono          = False
     lazyload        = True
+    cache           = True
     
     # --------------------------------------------------------------------------------- #
     # --------------------------------------------------------------------------------- #
@@ -332,28 +690,35 @@ class Flexistack():
         else:
             _internal_args = []
 
+        self.actions = FlexiModules()
+        self.plugins = FlexiModules()
+        self._caches = {}
+        self._caches_changed = set()
+        self.middleware = type('', (), {})()
         self.debug = True if '--debug' in _internal_args else debug
         self.chrono = True if '--chrono' in _internal_args else False
         self.lazyload = False if '--no-lazy-load' in _internal_args else True
+        self.cache = False if '--no-cache' in _internal_args else True
         self.console = Consolio(spinner_type='dots')
         self.dprint(0,"inf","Flexistack:init()")
         self.parser = argparse.ArgumentParser()
         if project_dir == None:
             self.dprint(1,"wrn","project_dir: not given")                        
             try:
-                self.project_dir = os.path.dirname(inspect.stack()[1].filename)
-            except:
+                self.project_dir = os.path.dirname(os.path.abspath(sys._getframe(1).f_code.co_filename))
+            except (AttributeError, ValueError):
                 self.project_dir = os.getcwd()
         else:
             self.project_dir = os.path.abspath(os.path.normpath(project_dir))
         self.dprint(1,"cmp","project_dir: "+ self.project_dir) 
        
         _uuid_file = os.path.join(self.project_dir, ".uuid")
-        if os.path.exists(_uuid_file):
+        try:
             with open(_uuid_file, 'r') as read_uuid_file:
                 self.uuid = read_uuid_file.readline()
-        else:
+        except FileNotFoundError:
             self.dprint(1,"wrn","uuid: will be generated")    
+            import uuid
             self.uuid   = uuid.uuid4().hex
             with open(_uuid_file, 'w') as read_uuid_file:
                 read_uuid_file.write(self.uuid)
@@ -383,8 +748,116 @@ class Flexistack():
     @property    
     def helper(self):
         return Helper
+
+    # --------------------------------------------------------------------------------- #
+
+    def _load_cache(self, name):
+        """
+        Returns the discovery cache stored under `<project_dir>/.cache/<name>.json`, 
+        or an empty dictionary if it is missing, unreadable or written by another cache 
+        format or flexistack version.
+        """
+        from . import __version__
+
+        try:
+            with open(os.path.join(self.project_dir, ".cache", name + ".json"), 'r') as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('format') != _CACHE_FORMAT or data.get('version') != __version__:
+            self.dprint(1, "wrn", "cache: "+name+" discarded (outdated)")
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    # --------------------------------------------------------------------------------- #
+
+    def _cache_key(self, path):
+        """
+        Returns the key of a file in the discovery cache: its path relative to the project 
+        directory, so that a cache generated at build time stays valid once the application 
+        is relocated.
+        """
+        try:
+            return os.path.relpath(path, self.project_dir)
+        except ValueError:
+            return path
+
+    # --------------------------------------------------------------------------------- #
+
+    def _save_cache(self, name, data):
+        """
+        Atomically stores the discovery cache under `<project_dir>/.cache/<name>.json`, 
+        tagged with the cache format and flexistack version. Entries of files that no 
+        longer exist are dropped.
+        """
+        from . import __version__
+
+        cache_dir = os.path.join(self.project_dir, ".cache")
+        cache_path = os.path.join(cache_dir, name + ".json")
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_path + ".tmp", 'w') as cache_file:
+                json.dump({'format': _CACHE_FORMAT, 
+                           'version': __version__, 
+                           'entries': {k: v for k, v in data.items() if os.path.exists(os.path.join(self.project_dir, k))}}, cache_file)
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError as e:
+            self.dprint(1, "wrn", "cache: could not be stored ("+str(e)+")")
     
     # --------------------------------------------------------------------------------- #
+
+    def _cached_analysis(self, name, module_full_path, parse, dir_entry = None, indent = 2):
+        """
+        Returns `parse(module_full_path)`, memoized in the `name` discovery cache under the 
+        file's (mtime, size) stamp. The cache is read on first use; `_flush_cache` stores it 
+        back if it has changed. Entries without the keys the loaders need (see 
+        `_CACHE_FIELDS`) are treated as cache misses, then parsed again and replaced.
+        """
+        if self.cache == False:
+            return parse(module_full_path)
+        cache = self._caches.get(name)
+        if cache == None:
+            cache = self._caches[name] = self._load_cache(name)
+        stat = dir_entry.stat() if dir_entry != None else os.stat(module_full_path)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        key = self._cache_key(module_full_path)
+        entry = cache.get(key)
+        if isinstance(entry, dict) and entry.get('stamp') == stamp and _valid_meta(name, entry.get('meta', False)):
+            self.dprint(indent,"inf","Using cached analysis.")
+            return entry['meta']
+        meta = parse(module_full_path)
+        cache[key] = {'stamp': stamp, 'meta': meta}
+        self._caches_changed.add(name)
+        return meta
+
+    # --------------------------------------------------------------------------------- #
+
+    def _flush_cache(self, name):
+        """
+        Stores the `name` discovery cache if it has changed since it was read.
+        """
+        if name in self._caches_changed:
+            self._caches_changed.discard(name)
+            self._save_cache(name, self._caches[name])
+
+    # --------------------------------------------------------------------------------- #
+
+    def _resolve_dirs(self, dir_paths):
+        """
+        Returns the resolved list of the directories given to a loader (a path, or a 
+        list/tuple of paths), or None if none were given.
+        """
+        if not dir_paths:
+            self.dprint(1, "wrn", "dir_paths: not given")
+            return None
+        if isinstance(dir_paths, (str, os.PathLike)):
+            dir_paths = [dir_paths]
+        if not isinstance(dir_paths, (list, tuple)):    
+            raise Exception("Error: Flexistack `dir_paths` required argument is not a type of list[str]")   
+        return self.get_filepath(list(dir_paths))
+
+    # --------------------------------------------------------------------------------- #
         
     def load_plugins(self, dir_paths):
         """
@@ -396,64 +869,57 @@ class Flexistack():
         containing the plugins to load.  
         """  
         
-        def _load(module_full_path):
-            with open(module_full_path,'r') as m_file:
-                m_tree = ast.parse(m_file.read(),filename=module_full_path)
-                found = False
-                for node in ast.walk(m_tree):
-                    if found == True:
-                        break
-                    if isinstance(node,ast.ClassDef):
-                        for decorator in node.decorator_list:
-                            if (isinstance(decorator,ast.Call) and hasattr(decorator,'func') 
-                                and hasattr(decorator,'args') and isinstance(decorator.args,list)):
-                                if isinstance(decorator.func,ast.Name) and hasattr(decorator.func,'id'):
-                                    dec_name = decorator.func.id
-                                elif isinstance(decorator.func,ast.Attribute) and hasattr(decorator.func,'attr'):
-                                    dec_name = decorator.func.attr
-                                else:
-                                    self.dprint(2, "wrn", "Skipped.")
-                                    continue    
-                                if dec_name == 'flexi_plugin'  and len(decorator.args)==3:
-                                    p_name = decorator.args[0].value
-                                    p_vers = decorator.args[1].value
-                                    p_desc = decorator.args[2].value                                                   
-                                    if self.plugins.get(p_name) is None:
-                                        self.plugins[p_name] = FlexiModPack()
-                                    self.plugins[p_name][p_vers] = FlexiModule(module_full_path,p_desc, node.name, self, None, self.lazyload)
-                                    self.dprint(2, "cmp", "Loaded!")
-                                    found = True
-                                    break
-                                else:
-                                    self.dprint(2, "wrn", "Skipped.")                                              
-                            else:
-                                self.dprint(2, "wrn", "Skipped.")
-                    else:
-                        self.dprint(2, "wrn", "Skipped.")            
+        def _parse(module_full_path):
+            with open(module_full_path,'rb') as m_file:
+                source = m_file.read()
+            if b'flexi_plugin' not in source:
+                return None
+            import ast
+            node, decorator = _flexi_decorator(ast.parse(source,filename=module_full_path), 'flexi_plugin', 3)
+            if node == None:
+                return None
+            return {'class': node.name, 
+                    'name': decorator.args[0].value,
+                    'version': decorator.args[1].value,
+                    'description': decorator.args[2].value}
+
+        def _load(module_full_path, dir_entry = None):
+            meta = self._cached_analysis("plugins", module_full_path, _parse, dir_entry)
+            if meta == None:
+                self.dprint(2, "wrn", "Skipped.")
+                return
+            if self.plugins.get(meta['name']) is None:
+                self.plugins[meta['name']] = FlexiModPack()
+            self.plugins[meta['name']][meta['version']] = FlexiModule(module_full_path, meta['description'], meta['class'], self, None, self.lazyload)
+            loaded_paths.append(module_full_path)
+            self.dprint(2, "cmp", "Loaded!")
 
         self.dprint(0, "inf", "Flexistack:load_plugins()")        
-        if not dir_paths:
-            self.dprint(1, "wrn", "dir_paths: not given")
+        dir_paths = self._resolve_dirs(dir_paths)
+        if dir_paths == None:
             return
-        if isinstance(dir_paths, str):
-            dir_paths = [dir_paths]
-        if not isinstance(dir_paths, list):    
-            raise Exception("Error: Flexistack `dir_paths` required argument is not a type of list[str]")   
 
-        for dir_path in dir_paths:
-            dir_path = self.get_filepath(dir_path)
-            for root, dirs, files in os.walk(dir_path):
-                for filename in files:
-                    if filename.endswith('.py') and filename != '__init__.py' and filename != '__pycache__':
-                        module_full_path = os.path.join(root, filename)
-                        self.dprint(1, "wip", "Start loading: " + module_full_path)
-                        try:
-                            _load(module_full_path)
-                        except Exception as e:
-                            self.dprint(1, "err", "Exception: " + str(e))
-                            pass        
+        loaded_paths = []
 
-    # --------------------------------------------------------------------------------- #
+        def _scan(_dir_paths):
+            for dir_entry in _unique_python_files(_dir_paths, lambda e: self.dprint(1, "err", "Exception: " + str(e))):
+                if dir_entry.name == '__init__.py':
+                    continue
+                module_full_path = dir_entry.path
+                self.dprint(1, "wip", "Start loading: " + module_full_path)
+                try:
+                    _load(module_full_path, dir_entry)
+                except Exception as e:
+                    self.dprint(1, "err", "Exception: " + str(e))
+            self._flush_cache("plugins")
+            if self.lazyload == True and loaded_paths and not sys.dont_write_bytecode:
+                threading.Thread(target=_precompile, args=(tuple(loaded_paths),)).start()
+
+        if self.lazyload == True:
+            self.dprint(1, "inf", "Deferred until first plugin access")
+            self.plugins.defer(lambda: _scan(dir_paths))
+        else:
+            _scan(dir_paths)
 
     # --------------------------------------------------------------------------------- #
 
@@ -468,51 +934,51 @@ class Flexistack():
         """      
 
         self.dprint(0, "inf", "Flexistack:load_middleware()")         
-        if dir_paths is None:
-            self.dprint(1, "wrn", "dir_paths: not given")
+        dir_paths = self._resolve_dirs(dir_paths)
+        if dir_paths == None:
             return
-        if isinstance(dir_paths, str):
-            dir_paths = [dir_paths]
-        if not isinstance(dir_paths, list):    
-            raise Exception("Error: Flexistack `dir_paths` required argument is not a type of list[str]")   
 
-        for dir_path in dir_paths:     
-            dir_path = self.get_filepath(dir_path)         
-            modules_paths = [str(path) for path in Path(dir_path).rglob("*.py")]
-            for module_path in modules_paths:
-                self.dprint(1, "wip", "Start loading: " + module_path)
-                base_name = os.path.splitext(os.path.basename(module_path))[0]
-                unique_suffix = ''.join(random.choices(string.ascii_letters, k=6))
-                module_name = f"{base_name}_{unique_suffix}"
-                try:
-                    spec = importlib.util.spec_from_file_location(module_name, module_path)
-                    if spec is None:
+        for dir_entry in _unique_python_files(dir_paths, lambda e: self.dprint(1, "err", "Exception: " + str(e))):
+            module_path = dir_entry.path
+            self.dprint(1, "wip", "Start loading: " + module_path)
+            try:
+                with open(module_path, 'rb') as m_file:
+                    if b'flexi_middleware' not in m_file.read():
+                        self.dprint(2, "wrn", "Skipped (no middleware declared).")
                         continue
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-
-                    for name, obj in vars(module).items():
-                        if inspect.isclass(obj) and obj.__module__ == module_name:
-                            if name == "Flexistack":
-                                continue
-                            self.dprint(2, "wip", f"Check class (under {module_name}): '{name}'")
-                            if hasattr(obj, '_flexi_'):
-                                if obj._flexi_.get('type') == "middleware":
-                                    sys.modules[module_name] = module
-                                    obj(self.middleware)
-                                    self.dprint(2, "cmp", "Loaded!")
-                                    
-                                else:
-                                    self.dprint(2, "wrn", "Skipped.")
+            except OSError as e:
+                self.dprint(1, "err", "Exception: " + str(e))
+                continue
+            base_name = dir_entry.name[:-3]
+            module_name = f"{base_name}_{next(_MODULE_IDS)}"
+            try:
+                spec = importlib.util.spec_from_file_location(module_name, module_path)
+                if spec is None:
+                    continue
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+
+                for name, obj in vars(module).items():
+                    if isinstance(obj, type) and obj.__module__ == module_name:
+                        if name == "Flexistack":
+                            continue
+                        self.dprint(2, "wip", f"Check class (under {module_name}): '{name}'")
+                        if hasattr(obj, '_flexi_'):
+                            if obj._flexi_.get('type') == "middleware":
+                                sys.modules[module_name] = module
+                                obj(self.middleware)
+                                self.dprint(2, "cmp", "Loaded!")
+                                
                             else:
                                 self.dprint(2, "wrn", "Skipped.")
-                except Exception as e:
-                    self.dprint(1, "err", "Exception: " + str(e))
-                    pass
-                
+                        else:
+                            self.dprint(2, "wrn", "Skipped.")
+            except Exception as e:
+                self.dprint(1, "err", "Exception: " + str(e))
+            
     # --------------------------------------------------------------------------------- #
     
-    def load_actions(self, dir_paths):  
+    def load_actions(self, dir_paths, filter = None):  
         """
         Loads all actions from a specified directory and enlists them 
         in the Flexistack Actions.
@@ -521,124 +987,158 @@ class Flexistack():
         - parser: argparser to be used
         - dir_paths: A string or list of strings representing the path(s) to the directory(ies) 
           containing the plugins to load.  
+        - filter: (optional) Name, or list of names (command path), of the action requested on 
+          the command line, e.g. ['generate', 'random-number']. Only the entries along the 
+          part of the path that exists are registered; otherwise all actions are loaded.
         """ 
         
-        def _load(_directory, _parser, _subparser):
+        def _parse(module_full_path):
+            with open(module_full_path,'rb') as m_file:
+                source = m_file.read()
+            if b'flexi_action' not in source:
+                return None
+            import ast
+            node, decorator = _flexi_decorator(ast.parse(source,filename=module_full_path), 'flexi_action', 2)
+            if node == None:
+                return None
+            as_optional = decorator.args[0].value
+            description = decorator.args[1].value
+            if as_optional != None:
+                return {'class': node.name, 'description': description, 
+                        'type': 'optional', 'as_optional': as_optional}
+            for set_optional_args in node.body:
+                if isinstance(set_optional_args,ast.FunctionDef) and set_optional_args.name == "set_optional_arguments":
+                    arguments = []
+                    for parg in set_optional_args.body:
+                        if isinstance(parg,ast.Expr) and isinstance(parg.value,ast.Call):
+                            v = [arg.value for arg in parg.value.args] 
+                            if len(v) not in (1, 2):
+                                continue
+                            kw = {item.arg: item.value for item in parg.value.keywords}
+                            arguments.append({
+                                'flags': v,
+                                'action': kw['action'].value if 'action' in kw else None,
+                                'help': kw['help'].value if 'help' in kw else None,
+                                'nargs': kw['nargs'].value if 'nargs' in kw else None,
+                                'type': kw['type'].id if 'type' in kw else None})
+                    return {'class': node.name, 'description': description, 
+                            'type': 'positional', 'arguments': arguments}
+            return None
+
+        def _load(_directory, _parser, _subparser, _filter = None):
             subdirs = []
-            for itempath in os.listdir(_directory):
+            with os.scandir(_directory) as dir_entries:
+                dir_entries = list(dir_entries)
+            for dir_entry in dir_entries:
+                itempath = dir_entry.name
                 try:
                     if itempath == '__pycache__' or itempath == '.flexistack':
                         continue      
+                    if _filter != None and itempath != _filter[0] and itempath != _filter[0] + ".py":
+                        continue
                     self.dprint(2,"wip","Loading: "+itempath)
-                    if isdir(join(_directory, itempath)):
+                    if dir_entry.is_dir():
                         self.dprint(3,"wip","Try to load as intermediate positional argument. (group)")                      
-                        dotflexfilepath = os.path.abspath(os.path.normpath(os.path.join(_directory, itempath, ".flexistack")))
-                        if not os.path.exists(dotflexfilepath):
-                            self.dprint(3,"wrn","Skipped (.flexistack file not found).")                           
-                            continue  
                         try:  
-                            with open(dotflexfilepath, 'r') as dotflexfile:                                 
+                            with open(os.path.join(dir_entry.path, ".flexistack"), 'r') as dotflexfile:                                 
                                 subdir_data = json.load(dotflexfile)
-                                subdirs.append((subdir_data['z-index'],itempath,os.path.join(_directory, itempath),subdir_data['description']))                                
-                        except:
+                                subdirs.append((subdir_data['z-index'],itempath,dir_entry.path,subdir_data['description']))                                
+                        except FileNotFoundError:
+                            self.dprint(3,"wrn","Skipped (.flexistack file not found).")                           
+                            continue  
+                        except (OSError, ValueError, KeyError, TypeError):
                             self.dprint(3,"err","Could not properly parse the .flexistack file. Skipped.")  
                             continue
                         self.dprint(3,"cmp","Loaded!")
-                    elif isfile(join(_directory, itempath)) and ".py" in itempath and not ".pyc" in itempath and not "__init__" in itempath:
+                    elif dir_entry.is_file() and itempath.endswith(".py") and itempath != "__init__.py":
                         self.dprint(3,"wip","Try to load as leaf positional argument.")
                         relative_action = os.path.relpath(_directory, dir_path)
                         relative_action = '' if relative_action == "." else relative_action + "/"                     
-                        command  = itempath.replace(".py", "")
+                        command  = itempath[:-3]
                         action_name = relative_action + command
-                        module_full_path = os.path.join(_directory, itempath)
-                        with open(module_full_path,'r') as m_file:
-                            try:
-                                m_tree = ast.parse(m_file.read(),filename=module_full_path)                
-                                found = False
-                                for node in ast.walk(m_tree):                    
-                                    if found == True:
-                                        break
-                                    if isinstance(node,ast.ClassDef):
-                                        for decorator in node.decorator_list:
-                                            if found == True:
-                                                break
-                                            if isinstance(decorator,ast.Call) and hasattr(decorator,'func') and hasattr(decorator,'args') and isinstance(decorator.args,list):
-                                                if isinstance(decorator.func,ast.Name) and hasattr(decorator.func,'id'):
-                                                    dec_name = decorator.func.id
-                                                elif isinstance(decorator.func,ast.Attribute) and hasattr(decorator.func,'attr'):
-                                                    dec_name = decorator.func.attr
-                                                else:
-                                                    self.dprint(2, "wrn", "Skipped.")
-                                                    continue    
-                                                if dec_name == 'flexi_action'  and len(decorator.args)==2:
-                                                    as_optional = decorator.args[0].value
-                                                    description = decorator.args[1].value
-                                                    if as_optional == None:
-                                                        for set_optional_args in node.body:
-                                                            if isinstance(set_optional_args,ast.FunctionDef) and set_optional_args.name == "set_optional_arguments":
-                                                                if self.actions.get(action_name) is None:
-                                                                    self.actions[action_name] = FlexiModule(module_full_path, description, node.name, self, 'positional' , self.lazyload)                                                        
-                                                                    __subparser = _subparser.add_parser(command,help=description)
-                                                                    for parg in set_optional_args.body:
-                                                                        if isinstance(parg,ast.Expr) and isinstance(parg.value,ast.Call):
-                                                                            v = [arg.value for arg in parg.value.args] 
-                                                                            _act = next((item.value.value for item in parg.value.keywords if item.arg == 'action'), None)
-                                                                            _des = next((item.value.value for item in parg.value.keywords if item.arg == 'help'), None)
-                                                                            _narg = next((item.value.value for item in parg.value.keywords if item.arg == 'nargs'), None)
-                                                                            _tp = next((eval(item.value.id) for item in parg.value.keywords if item.arg == 'type'), None)
-                                                                            if len(v) == 2:
-                                                                                __subparser.add_argument(v[0],v[1],type=_tp,nargs=_narg,action=_act,help=_des)
-                                                                            elif len(v) == 1:
-                                                                                __subparser.add_argument(v[0],type=_tp,nargs=_narg,action=_act,help=_des)
-                                                                    self.dprint(3, "cmp", "Loaded!") 
-                                                                    found = True
-                                                                    break
-                                                    else:
-                                                        if self.actions.get(action_name) is None:
-                                                            self.actions[action_name] = FlexiModule(module_full_path, description, node.name, self, 'optional', self.lazyload)  
-                                                            _parser.add_argument('-'+command[0],'--'+command, action=as_optional, help=description)
-                                                            self.dprint(3,"cmp","Loaded!")
-                                                            found = True
-                                                            break
-                                                else:
-                                                    self.dprint(2, "wrn", "Skipped.")  
-                                            else:
-                                                self.dprint(2, "wrn", "Skipped.") 
-                            except Exception as e:
-                                self.dprint(2, "err", "There was an error during the file analysis:"+str(e))                                                
+                        module_full_path = dir_entry.path
+                        if self.actions.get(action_name) is not None:
+                            continue
+                        try:
+                            meta = self._cached_analysis("actions", module_full_path, _parse, dir_entry, 3)
+                        except Exception as e:
+                            self.dprint(2, "err", "There was an error during the file analysis:"+str(e))
+                            continue
+                        if meta == None:
+                            continue
+                        self.actions[action_name] = FlexiModule(module_full_path, meta['description'], meta['class'], self, meta['type'], self.lazyload)
+                        if meta['type'] == 'positional':
+                            __subparser = _subparser.add_parser(command,help=meta['description'])
+                            for arg in meta['arguments']:
+                                _tp = getattr(builtins, arg['type']) if arg['type'] != None else None
+                                __subparser.add_argument(*arg['flags'],type=_tp,nargs=arg['nargs'],action=arg['action'],help=arg['help'])
+                        else:
+                            _parser.add_argument('-'+command[0],'--'+command, action=meta['as_optional'], help=meta['description'])
+                        self.dprint(3,"cmp","Loaded!")
                 except Exception as e:
                     self.dprint(2, "err", "Could not be loaded :"+str(e))                                   
             subdirs.sort(key=lambda tup: tup[0])      
             for dir_details in subdirs:
                 __parser = _subparser.add_parser(dir_details[1], help=dir_details[3])
                 __subparser = __parser.add_subparsers(title='Available commands', dest=dir_details[1]+'_action')
-                _load(dir_details[2],__parser,__subparser)
+                _load(dir_details[2],__parser,__subparser,_filter[1:] if _filter != None and len(_filter) > 1 else None)
 
 
         self.dprint(0, "inf", "Flexistack:load_action()")        
-        if not dir_paths:
-            self.dprint(1, "wrn", "dir_paths: not given")
+        dir_paths = self._resolve_dirs(dir_paths)
+        if dir_paths == None:
             return
-        if isinstance(dir_paths, str):
-            dir_paths = [dir_paths]
-        if not isinstance(dir_paths, list):    
-            raise Exception("Error: Flexistack `dir_paths` required argument is not a type of list[str]") 
-        
+
+        def _match(_directory, _tokens):
+            matched = []
+            for token in _tokens:
+                module_full_path = join(_directory, token + ".py")
+                if isfile(module_full_path):
+                    try:
+                        meta = self._cached_analysis("actions", module_full_path, _parse, None, 3)
+                    except Exception:
+                        meta = None
+                    if meta != None and meta['type'] == 'positional':
+                        matched.append(token)
+                    break
+                if not os.path.exists(join(_directory, token, ".flexistack")):
+                    break
+                matched.append(token)
+                _directory = join(_directory, token)
+            return matched
+
+        if isinstance(filter, str):
+            filter = [filter]
+        if filter:
+            requested = filter
+            filter = max((_match(dir_path, requested) for dir_path in dir_paths), key=len) or None
+            if filter != None:
+                self.dprint(1,"cmp","filter: "+" ".join(filter))
+            else:
+                self.dprint(1,"wrn","filter: '"+" ".join(requested)+"' not found, loading all actions")
+        else:
+            filter = None
+
         subparsers  = self.parser.add_subparsers(title="Available actions", dest='action') 
 
+        seen = set()
         for dir_path in dir_paths:
-            dir_path = self.get_filepath(dir_path) 
+            real_path = os.path.realpath(dir_path)
+            if real_path in seen:
+                continue
+            seen.add(real_path)
             self.dprint(1,"wip","Start loading from: "+dir_path)
-            _load(dir_path, self.parser, subparsers)
-        pass
+            _load(dir_path, self.parser, subparsers, filter)
+
+        self._flush_cache("actions")
     
     # --------------------------------------------------------------------------------- #
 
-    def load(self, middleware_dirs, actions_dirs, plugins_dirs):  
+    def load(self, middleware_dirs, actions_dirs, plugins_dirs, actions_filter = None):  
         if self.chrono == False:
             self.load_middleware(middleware_dirs)     
             self.load_plugins(plugins_dirs)    
-            self.load_actions(actions_dirs)
+            self.load_actions(actions_dirs, actions_filter)
         else:
             s1 = time.process_time()
             s2 = time.time()
@@ -650,7 +1150,7 @@ class Flexistack():
             self.dprint(0,"inf",f"Plugins loading time: (P){(time.process_time() - s1):.5f} (R){(time.time() - s2):.5f}",True)            
             s1 = time.process_time()
             s2 = time.time()
-            self.load_actions(actions_dirs)
+            self.load_actions(actions_dirs, actions_filter)
             self.dprint(0,"inf",f"Actions loading time: (P){(time.process_time() - s1):.5f} (R){(time.time() - s2):.5f}",True)
     # --------------------------------------------------------------------------------- #
 
@@ -708,40 +1208,37 @@ class Flexistack():
                             self.dprint(0,"inf",f"Selected action run time: (none:init failed)",True)                      
                         return False
             else:
-                iterration = 0
                 cur_act_level = parsed_args['action']
-                appender = ""
-                while True:
-                    iterration = iterration + 1
-                    if iterration > 5:
-                        self.dprint(0,"err","Commands depths cannot be achived (inf.loop.breaker)")
-                        return False         
-                    if (cur_act_level+"_action" in parsed_args) and parsed_args[cur_act_level+"_action"] == None:
+                action_path = [cur_act_level]
+                while cur_act_level+"_action" in parsed_args:
+                    cur_act_level = parsed_args[cur_act_level+"_action"]
+                    if cur_act_level == None:
                         self.dprint(0,"err","Incomplete command. Please use -h <--help> for more information")
                         return False
-                    elif cur_act_level+"_action" in parsed_args:
-                        appender = appender + cur_act_level+"/"
-                        cur_act_level = parsed_args[cur_act_level+"_action"]
-                    else:
-                        sL1 = time.time()
-                        sL2 = time.process_time()
-                        obj = self.actions[appender+cur_act_level](self)
-                        sI1 = time.time()
-                        sI2 = time.process_time()
-                        if obj.init(pargs=parsed_args,project_dir=project_dir) == True:
-                            sR1 = time.time()
-                            sR2 = time.process_time()
-                            r = obj.run()
-                            if self.chrono == True:
-                                self.dprint(0,"inf",f"Selected action loading time: (P){(sI2 - sL2):.5f} (R){(sI1 - sL1):.5f}",True)
-                                self.dprint(0,"inf",f"Selected action init time: (P){(sR2 - sI2):.5f} (R){(sR1 - sI1):.5f}",True)
-                                self.dprint(0,"inf",f"Selected action run time: (P){(time.process_time() - sR2):.5f} (R){(time.time() - sR1):.5f}",True)
-                            return r             
-                        if self.chrono == True:
-                            self.dprint(0,"inf",f"Selected action loading time: (P){(sI2 - sL2):.5f} (R){(sI1 - sL1):.5f}",True)
-                            self.dprint(0,"inf",f"Selected action lnit time: (P){(sR2 - sI2):.5f} (R){(sR1 - sI1):.5f}",True)
-                            self.dprint(0,"inf",f"Selected action run time: (none:init failed)",True)                      
+                    if len(action_path) >= len(parsed_args):
+                        self.dprint(0,"err","Commands depths cannot be achived (inf.loop.breaker)")
                         return False
+                    action_path.append(cur_act_level)
+
+                sL1 = time.time()
+                sL2 = time.process_time()
+                obj = self.actions["/".join(action_path)](self)
+                sI1 = time.time()
+                sI2 = time.process_time()
+                if obj.init(pargs=parsed_args,project_dir=project_dir) == True:
+                    sR1 = time.time()
+                    sR2 = time.process_time()
+                    r = obj.run()
+                    if self.chrono == True:
+                        self.dprint(0,"inf",f"Selected action loading time: (P){(sI2 - sL2):.5f} (R){(sI1 - sL1):.5f}",True)
+                        self.dprint(0,"inf",f"Selected action init time: (P){(sR2 - sI2):.5f} (R){(sR1 - sI1):.5f}",True)
+                        self.dprint(0,"inf",f"Selected action run time: (P){(time.process_time() - sR2):.5f} (R){(time.time() - sR1):.5f}",True)
+                    return r             
+                if self.chrono == True:
+                    self.dprint(0,"inf",f"Selected action loading time: (P){(sI2 - sL2):.5f} (R){(sI1 - sL1):.5f}",True)
+                    self.dprint(0,"inf",f"Selected action lnit time: (P){(sR2 - sI2):.5f} (R){(sR1 - sI1):.5f}",True)
+                    self.dprint(0,"inf",f"Selected action run time: (none:init failed)",True)                      
+                return False
         except Exception as e: 
             print(e)
             return False
@@ -789,10 +1286,8 @@ class Flexistack():
 
         _plugins = []
         for plugin in self.plugins:
-            versions = self.plugins[plugin].versions()
-            versions.sort()
             _versions = []
-            for v in versions:
+            for v in reversed(self.plugins[plugin].versions()):
                 rv = self.plugins[plugin][v].d or "No available description"
                 if details == False:
                     _versions.append({str(v): {"description":rv}})
@@ -825,22 +1320,44 @@ class Flexistack():
     def get_filepath(self, paths, project_dir = None):
         _results = []
         _project_dir = project_dir if project_dir != None else self.project_dir
-        _paths = [paths] if isinstance(paths,str) else paths
+        _single = isinstance(paths,(str, os.PathLike))
+        _paths = [paths] if _single else paths
+        _cwd = os.getcwd()
         for path in _paths:
-            if path.startswith("::"):
-                path = path[2:]
-                path = path[1:] if path.startswith("/") else path
-                path = path[1:] if path.startswith("\\") else path
-                _results.append(Helper.resolve_path(os.path.normpath(os.path.join(os.getcwd(),path))))
-            elif path.startswith(":"):
-                path = path[1:]
-                path = path[1:] if path.startswith("/") else path
-                path = path[1:] if path.startswith("\\") else path
-                _results.append(Helper.resolve_path(os.path.normpath(os.path.join(_project_dir,path))))
-            else:
-                _results.append(Helper.resolve_path(os.path.normpath(path)))
-        return _results[0] if isinstance(paths,str) else _results
+            _results.append(Helper.resolve_path(_join_filepath(os.fspath(path), _project_dir, _cwd)))
+        return _results[0] if _single else _results
         
+#########################################################################################
+# DECORATOR HELPERS                                                                     #
+######################################################################################### 
+
+def _required_plugins(cls):
+    """
+    Returns the `req_plugins` of the decorated class as a tuple without duplicates 
+    (in declaration order, so that reports are deterministic), computed once at 
+    decoration time.
+    """
+    try:
+        return tuple(dict.fromkeys(getattr(cls, 'req_plugins', None) or ()))
+    except TypeError:
+        return ()
+
+# ------------------------------------------------------------------------------------- #
+
+def _check_required_plugins(obj, req_plugins):
+    """
+    Warns (through the flexistack instance) when any of the required plugins is missing.
+    """
+    if not req_plugins or obj.flexistack == None:
+        return
+    try:
+        plugins = obj.flexistack.plugins
+        missing = next((name for name in req_plugins if name not in plugins), None)
+        if missing != None:
+            obj.flexistack.dprint(0,"wrn",str(obj.__class__)+" missing required plugin: "+missing)
+    except (AttributeError, TypeError) as e:
+        obj.flexistack.dprint(0,"wrn",str(obj.__class__)+" plugins could not be loaded ("+str(e)+")")
+
 #########################################################################################
 # CLASS DECORATOR                                                                       #
 ######################################################################################### 
@@ -851,21 +1368,18 @@ def flexi_action(as_optional, description):
         cls._flexi_ = {'type':'action',
                        'as_optional' : as_optional,
                        'description':description}      
+        req_plugins = _required_plugins(cls)
 
         def action_init(self, flexistack=None):     
             self.basename = os.path.basename(sys.modules[cls.__module__].__file__)
             self.flexistack = flexistack 
-            try:
-                if hasattr(self, 'req_plugins'):
-                    if self.flexistack != None and self.req_plugins != None:
-                        if len(self.req_plugins) == 0:
-                            return
-                        if (set(self.req_plugins) - self.flexistack.plugins.keys()):
-                            self.flexistack.dprint(0,"wrn",str(self.__class__)+" missing required plugins")
-            except:
-                self.flexistack.dprint(0,"wrn",str(self.__class__)+" plugins could not be loaded")
+
+        def action_init_req(self, flexistack=None):
+            action_init(self, flexistack)
+            _check_required_plugins(self, req_plugins)
                 
-        cls.__init__ = action_init
+        action_init_req.__wrapped__ = action_init
+        cls.__init__ = action_init_req if req_plugins else action_init
         return cls
  
     return class_decorator
@@ -902,25 +1416,56 @@ def flexi_plugin(name,version,description):
                        'name': name,
                        'version':version,
                        'description':description}      
+        req_plugins = _required_plugins(cls)
 
         def plugin_init(self, flexistack=None):
             self.basename = os.path.basename(sys.modules[cls.__module__].__file__)
             self.flexistack = flexistack 
-            try:
-                if hasattr(self, 'req_plugins'):
-                    if self.flexistack != None and self.req_plugins != None:
-                        if len(self.req_plugins) == 0:
-                            return
-                        if (set(self.req_plugins) - self.flexistack.plugins.keys()):
-                            self.flexistack.dprint(0,"wrn",str(self.__class__)+" missing required plugins")
-            except:
-                self.flexistack.dprint(0,"wrn",str(self.__class__)+" plugins could not be loaded")        
+
+        def plugin_init_req(self, flexistack=None):
+            plugin_init(self, flexistack)
+            _check_required_plugins(self, req_plugins)
         
-        cls.__init__ = plugin_init
+        plugin_init_req.__wrapped__ = plugin_init
+        cls.__init__ = plugin_init_req if req_plugins else plugin_init
         return cls
  
     return class_decorator
 
+#########################################################################################
+# CLASS DECORATOR                                                                       #
+#########################################################################################         
+
+def requires_plugins(*names):
+    """
+    Declares the plugins required by an action or plugin class, merged with any 
+    `req_plugins` it already declares. A missing plugin is reported when the class is 
+    instantiated. When applied above `flexi_action`/`flexi_plugin`, the single check 
+    they installed is replaced by one covering the merged requirements.
+
+    Usage:
+        @flexi_action(None, 'Generate a random number')
+        @requires_plugins('dummy-generator')
+        class Action:
+            ...
+    """
+
+    def class_decorator(cls):
+        req_plugins = tuple(dict.fromkeys(_required_plugins(cls) + names))
+        cls.req_plugins = req_plugins
+        if getattr(cls, '_flexi_', {}).get('type') in ('action', 'plugin'):
+            flexi_init = getattr(cls.__init__, '__wrapped__', cls.__init__)
+
+            def requires_init(self, flexistack=None):
+                flexi_init(self, flexistack)
+                _check_required_plugins(self, req_plugins)
+
+            requires_init.__wrapped__ = flexi_init
+            cls.__init__ = requires_init
+        return cls
+
+    return class_decorator
+
 #########################################################################################
 # EOF                                                                                   #
 #########################################################################################
\ No newline at end of file
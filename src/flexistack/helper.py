@@ -25,13 +25,27 @@
 #########################################################################################
 
 import os
-import hashlib
-import platform
 import random
 import string
-import psutil
-import pyaes
-import base64
+import threading
+
+#########################################################################################
+# CONSTANTS                                                                             #
+#########################################################################################
+
+# Maps a random byte to an ASCII letter/digit; the last 8 byte values (256 % 62) are
+# rejected so that every character is equally likely.
+_ALPHANUMERIC = (string.ascii_letters + string.digits).encode('ascii')
+_ALPHANUMERIC_TABLE = bytes(_ALPHANUMERIC[b % len(_ALPHANUMERIC)] for b in range(256))
+_ALPHANUMERIC_REJECT = bytes(range(256 - 256 % len(_ALPHANUMERIC), 256))
+
+# One random.Random per thread so concurrent callers do not share (and contend on)
+# the module-level generator state.
+class _ThreadRandom(threading.local):
+    def __init__(self):
+        self.rng = random.Random()
+
+_RANDOM = _ThreadRandom()
 
 #########################################################################################
 # CLASS                                                                                 #
@@ -63,6 +77,7 @@ class Helper:
         """
         Resolves the given shortcut item to its target path, considering the operating system.
         """
+        import platform
         system = platform.system()
         if system == "Linux":
             return os.path.realpath(item)
@@ -80,6 +95,7 @@ class Helper:
         """
         Returns the total number of CPU cores, including logical and physical cores.
         """
+        import psutil
         return [psutil.cpu_count(logical=False), psutil.cpu_count()]
 
     # --------------------------------------------------------------------------------- #
@@ -88,19 +104,26 @@ class Helper:
         """
         Generates a random string of specified length using ASCII letters and digits.
         """
-        characters = string.ascii_letters + string.digits
-        random_string = ''.join(random.choice(characters) for _ in range(length))
-        return random_string
+        random_bytes = b''
+        while len(random_bytes) < length:
+            missing = length - len(random_bytes)
+            random_bytes += os.urandom(missing + (missing >> 4) + 1).translate(_ALPHANUMERIC_TABLE, _ALPHANUMERIC_REJECT)
+        return random_bytes[:length].decode('ascii')
 
     # --------------------------------------------------------------------------------- #
 
     def generate_random_number(length):
         """
-        Generates a random string of specified length using ASCII letters and digits.
+        Generates a random string of specified length using digits. Each block of up to
+        1000 digits comes from a single random integer (zero padded).
         """
-        characters =  string.digits
-        random_string = ''.join(random.choice(characters) for _ in range(length))
-        return random_string
+        randrange = _RANDOM.rng.randrange
+        digits = []
+        while length > 0:
+            block = min(length, 1000)
+            digits.append(f"{randrange(10 ** block):0{block}d}")
+            length -= block
+        return ''.join(digits)
     
     # --------------------------------------------------------------------------------- #
 
@@ -108,6 +131,7 @@ class Helper:
         """
         Returns the total virtual and swap memory in gigabytes.
         """
+        import psutil
         virtual = round(psutil.virtual_memory().total / (1024*1024*1024), 1)
         swap = round(psutil.swap_memory().total / (1024*1024*1024), 1)
         return [virtual, swap]
@@ -118,6 +142,7 @@ class Helper:
         """
         Computes the MD5 hash of the specified file.
         """
+        import hashlib
         hash_md5 = hashlib.md5()
         with open(fname, "rb") as f:
             for chunk in iter(lambda: f.read(8192), b""):
@@ -130,6 +155,7 @@ class Helper:
         """
         Computes the SHA-256 hash of the specified file.
         """
+        import hashlib
         hash_256 = hashlib.sha256()
         with open(fname, "rb") as f:
             for chunk in iter(lambda: f.read(4*65536), b""):
@@ -142,6 +168,9 @@ class Helper:
         """
         Encrypts the plaintext using AES algorithm with the provided key.
         """
+        import base64
+        import hashlib
+        import pyaes
         hash_256 = hashlib.sha256()
         hash_256.update(key.encode('utf-8'))
         key = hash_256.digest()
@@ -155,6 +184,9 @@ class Helper:
         """
         Decrypts the base64 encoded ciphertext using AES algorithm with the provided key.
         """
+        import base64
+        import hashlib
+        import pyaes
         hash_256 = hashlib.sha256()
         hash_256.update(key.encode('utf-8'))
         key = hash_256.digest()